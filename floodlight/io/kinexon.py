@@ -1,8 +1,10 @@
+import csv
 import warnings
 from pathlib import Path
 from typing import List, Dict, Tuple, Union
 
 import numpy as np
+import pandas as pd
 
 from floodlight.core.xy import XY
 
@@ -230,15 +232,20 @@ def get_meta_data(
             for identifier in sensor_links:
                 # extract identifier
                 if identifier not in pID_dict[group_id]:
-                    pID_dict[group_id].update({identifier: []})
-                # extract ids
-                if line[column_links[identifier]] not in pID_dict[group_id][identifier]:
-                    pID_dict[group_id][identifier].append(
-                        line[column_links[identifier]]
-                    )
+                    pID_dict[group_id].update({identifier: {}})
+                # extract ids (dict keys keep the order of appearance and allow
+                # constant-time lookups compared to scanning a list on every line)
+                pID_dict[group_id][identifier].setdefault(
+                    line[column_links[identifier]]
+                )
 
-    # sort dict
-    pID_dict = dict(sorted(pID_dict.items()))
+    # sort dict and convert collected ids to lists
+    pID_dict = {
+        group_id: {
+            identifier: list(pIDs) for identifier, pIDs in pID_dict[group_id].items()
+        }
+        for group_id in sorted(pID_dict)
+    }
 
     # estimate framerate
     timestamps = list(set(t))
@@ -331,15 +338,15 @@ def create_links_from_meta_data(
         # available sensor identifier
         identifier = _get_available_sensor_identifier(pID_dict)
 
-    links = {}
-    for group_id in pID_dict:
-        links.update(
-            {
-                group_id: {
-                    ID: xID for xID, ID in enumerate(pID_dict[group_id][identifier])
-                }
-            }
+    links = {
+        group_id: dict(
+            zip(
+                pID_dict[group_id][identifier],
+                range(len(pID_dict[group_id][identifier])),
+            )
         )
+        for group_id in pID_dict
+    }
 
     return links
 
@@ -379,9 +386,13 @@ def read_position_data_csv(
     links = create_links_from_meta_data(pID_dict)
     # get column-links
     column_links = _get_column_links(filepath_data, delimiter)
-    column_links_set = set(column_links)
-    group_identifier_set = {"group_id", "group_name"}
-    recorded_group_identifier = list(column_links_set & group_identifier_set)
+    # group identifier, favoring group_name over group_id (see _get_group_id)
+    if "group_name" in column_links:
+        group_identifier = "group_name"
+    elif "group_id" in column_links:
+        group_identifier = "group_id"
+    else:
+        group_identifier = None
 
     # available sensor identifier
     identifier = _get_available_sensor_identifier(pID_dict)
@@ -399,35 +410,61 @@ def read_position_data_csv(
             }
         )
 
-    # loop
-    with open(str(filepath_data), "r", encoding="utf-8") as f:
-        # skip the header of the file
-        _ = f.readline()
-        while True:
-            line_string = f.readline()
-            # terminate if at end of file
-            if len(line_string) == 0:
-                break
-            # split str
-            line = line_string.split(delimiter)
-            timestamp = int(line[column_links["time"]])
-            # set group
-            group_id = _get_group_id(recorded_group_identifier, column_links, line)
-            # set column
-            x_col = links[group_id][line[column_links[identifier]]] * 2
-            y_col = x_col + 1
-            # set row
-            row = int((timestamp - t_null) / (1000 / framerate))
-            # set (x, y)-data
-            x_coordinate = line[column_links["x_coord"]]
-            y_coordinate = line[column_links["y_coord"]]
-
-            # insert (x, y)-data into column and row of respective array
-            if x_coordinate != "":
-                xydata[group_id][row, x_col] = x_coordinate
-
-            if y_coordinate != "":
-                xydata[group_id][row, y_col] = y_coordinate
+    # read relevant columns at once, keeping identifiers as raw strings and only
+    # treating empty coordinate fields as missing values
+    time_col = column_links["time"]
+    id_col = column_links[identifier]
+    x_col = column_links["x_coord"]
+    y_col = column_links["y_coord"]
+    dtypes = {time_col: np.int64, id_col: str, x_col: np.float64, y_col: np.float64}
+    if group_identifier is not None:
+        dtypes.update({column_links[group_identifier]: str})
+    data = pd.read_csv(
+        str(filepath_data),
+        sep=delimiter,
+        header=None,
+        skiprows=1,
+        usecols=list(dtypes),
+        dtype=dtypes,
+        keep_default_na=False,
+        na_values={x_col: [""], y_col: [""]},
+        quoting=csv.QUOTE_NONE,
+        float_precision="round_trip",
+        encoding="utf-8",
+        engine="c",
+    )
+
+    # set rows
+    rows = ((data[time_col].values - t_null) / (1000 / framerate)).astype(int)
+
+    # line indices for each group
+    if group_identifier is None:
+        group_lines = {"0": np.arange(len(data))}
+    else:
+        group_lines = data.groupby(column_links[group_identifier], sort=False).indices
+
+    for group_id, lines in group_lines.items():
+        # set columns
+        x_cols = data[id_col].iloc[lines].map(links[group_id]).values * 2
+        y_cols = x_cols + 1
+        group_rows = rows[lines]
+        # set (x, y)-data
+        x_coordinates = data[x_col].values[lines]
+        y_coordinates = data[y_col].values[lines]
+
+        # insert recorded (x, y)-data into columns and rows of respective array, where
+        # the last record wins if a sensor has several records in the same frame
+        for cols, coordinates in ((x_cols, x_coordinates), (y_cols, y_coordinates)):
+            recorded = np.flatnonzero(~np.isnan(coordinates))
+            is_last = (
+                ~pd.DataFrame({"row": group_rows[recorded], "col": cols[recorded]})
+                .duplicated(keep="last")
+                .values
+            )
+            recorded = recorded[is_last]
+            xydata[group_id][group_rows[recorded], cols[recorded]] = coordinates[
+                recorded
+            ]
 
     data_objects = []
     for group_id in xydata:
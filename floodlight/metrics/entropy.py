@@ -1,5 +1,6 @@
 import numpy as np
 import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def approx_entropy(sig: npt.NDArray, m: int = 2, r: float = 0.5) -> float:
@@ -61,10 +62,9 @@ def approx_entropy(sig: npt.NDArray, m: int = 2, r: float = 0.5) -> float:
         Phi: sample entropy
         """
         no_parts = N - m_ + 1
-        x_i_s = np.zeros((no_parts, m_))
-        # determine reference patterns for chosen segment lengths
-        for i in range(no_parts):
-            x_i_s[i, :] = sig[i : (i + m_)]
+        # determine reference patterns for chosen segment lengths, promoting integer
+        # or single precision signals to float64 for the distance computation
+        x_i_s = sliding_window_view(sig, m_).astype(np.float64)
         # placeholder for to determine pattern regularity
         c_i_m_r_s = np.zeros(no_parts)
         # iterate through all comparisons
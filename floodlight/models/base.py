@@ -28,11 +28,9 @@ class BaseModel:
         """Returns ``True`` if all model parameters (those with a trailing underscore)
         are fitted (i.e. not None), and ``False`` otherwise."""
         fitted = all(
-            [
-                vars(self)[v] is not None
-                for v in vars(self)
-                if (v.endswith("_") and not v.startswith("__"))
-            ]
+            value is not None
+            for name, value in vars(self).items()
+            if (name.endswith("_") and not name.startswith("__"))
         )
 
         return fitted
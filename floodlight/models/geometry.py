@@ -1,7 +1,6 @@
 import warnings
 
 import numpy as np
-from scipy.spatial.distance import cdist
 
 from floodlight import XY
 from floodlight.core.property import TeamProperty, PlayerProperty
@@ -77,25 +76,24 @@ class CentroidModel(BaseModel):
         """
         if not exclude_xIDs:
             exclude_xIDs = []
-        # boolean for column inclusion, initialize to True for all columns
-        include = np.full((xy.N * 2), True)
-
-        # exclude columns according to exclude_xIDs
         for xID in exclude_xIDs:
             if xID not in range(0, xy.N):
                 raise ValueError(
                     f"Expected entries of exclude_xIDs to be in range 0 to {xy.N}, "
                     f"got {xID}."
                 )
-            exclude_start = xID * 2
-            exclude_end = exclude_start + 2
-            include[exclude_start:exclude_end] = False
+
+        # boolean for player inclusion, excluding players according to exclude_xIDs
+        include = np.full(xy.N, True)
+        include[list(exclude_xIDs)] = False
 
         with warnings.catch_warnings():
             # supress warnings caused by empty slices
             warnings.filterwarnings("ignore", category=RuntimeWarning)
-            # calculate centroid
-            centroids = np.nanmean(xy.xy[:, include].reshape((len(xy), -1, 2)), axis=1)
+            # calculate centroid over included players of the (T, N, 2)-shaped view
+            centroids = np.nanmean(
+                xy.xy.reshape((len(xy), xy.N, 2))[:, include], axis=1
+            )
 
         # wrap as XY object
         self._centroid_ = XY(
@@ -143,23 +141,16 @@ class CentroidModel(BaseModel):
                 f"({T})."
             )
 
-        # calculate distances on specified axis
-        distances = np.full((T, xy.N), np.nan)
+        # calculate distances on specified axis, broadcasting centroids over players
         if axis is None:
-            for t in range(T):
-                distances[t] = cdist(
-                    self._centroid_[t].reshape(-1, 2), xy[t].reshape(-1, 2)
-                )
+            distances = np.hypot(
+                xy.x - self._centroid_.x,
+                xy.y - self._centroid_.y,
+            )
         elif axis == "x":
-            for t in range(T):
-                distances[t] = cdist(
-                    self._centroid_.x[t].reshape(-1, 1), xy.x[t].reshape(-1, 1)
-                )
+            distances = np.abs(xy.x - self._centroid_.x)
         elif axis == "y":
-            for t in range(T):
-                distances[t] = cdist(
-                    self._centroid_.y[t].reshape(-1, 1), xy.y[t].reshape(-1, 1)
-                )
+            distances = np.abs(xy.y - self._centroid_.y)
         else:
             raise ValueError(
                 f"Expected axis to be one of (None, 'x', 'y'), got {axis}."
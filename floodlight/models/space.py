@@ -192,15 +192,20 @@ class DiscreteVoronoiModel(BaseModel):
             np.nan,
         )
 
+        # stack and reshape mesh coordinates to (M x 2) array once for all frames
+        mesh_points = np.stack((self._meshx_, self._meshy_), axis=2).reshape(-1, 2)
+
         # loop
         for t in range(T):
-            # stack and reshape player and mesh coordinates to (M x 2) arrays
+            # stack and reshape player coordinates to (N x 2) array
             player_points = np.hstack((xy1.frame(t), xy2.frame(t))).reshape(-1, 2)
-            mesh_points = np.stack((self._meshx_, self._meshy_), axis=2).reshape(-1, 2)
+
+            # only players with valid positions can control mesh points
+            valid_players = np.flatnonzero(~np.isnan(player_points).any(axis=1))
 
             # calculate pairwise distances and determine closest player
-            pairwise_distances = cdist(mesh_points, player_points)
-            closest_player_index = np.nanargmin(pairwise_distances, axis=1)
+            pairwise_distances = cdist(mesh_points, player_points[valid_players])
+            closest_player_index = valid_players[np.argmin(pairwise_distances, axis=1)]
             self._cell_controls_[t] = closest_player_index.reshape(self._meshx_.shape)
 
     def fit(self, xy1: XY, xy2: XY):
@@ -236,17 +241,19 @@ class DiscreteVoronoiModel(BaseModel):
         # infer number of mesh cells
         number_of_cells = self._cell_controls_.shape[1] * self._cell_controls_.shape[2]
 
-        # xID ranges for both team's players if stacked together
-        range1 = range(self._N1_)
-        range2 = range(self._N1_, self._N1_ + self._N2_)
+        # number of frames and players of both teams if stacked together
+        T = self._cell_controls_.shape[0]
+        N = self._N1_ + self._N2_
 
-        # for each xID count number of cell controls in each mesh through time
-        counts1 = [np.sum(self._cell_controls_ == xID, axis=(1, 2)) for xID in range1]
-        counts2 = [np.sum(self._cell_controls_ == xID, axis=(1, 2)) for xID in range2]
+        # offset xIDs per frame to count cell controls of all frames in a single pass
+        cell_controls = self._cell_controls_.reshape(T, -1)
+        frame_offsets = np.arange(T).reshape(-1, 1) * N
+        labels = (cell_controls + frame_offsets)[~np.isnan(cell_controls)]
+        counts = np.bincount(labels.astype(np.intp), minlength=T * N).reshape(T, N)
 
-        # transform to arrays and normalize
-        counts1 = np.array(counts1).transpose()
-        counts2 = np.array(counts2).transpose()
+        # split counts by team
+        counts1 = counts[:, : self._N1_]
+        counts2 = counts[:, self._N1_ :]
 
         # transform to percentages
         percentages1 = np.round(100 * counts1 / number_of_cells, 2)
@@ -43,26 +43,16 @@ def _get_filterable_and_short_sequences(
     # Convert possible None-types in data to np.NaN
     data = np.array(data, dtype=float)
 
-    # indices where nans and numbers are next to each other
-    change_points = np.where(np.diff(np.isnan(data), prepend=np.nan, append=np.nan))[0]
-    sequences = np.array(
-        [
-            (change_points[i], change_points[i + 1])
-            for i in range(len(change_points) - 1)
-        ]
-    )
+    # boundaries of non-NaN runs, zero-padded so runs at both ends are closed
+    is_number = np.concatenate(([False], ~np.isnan(data), [False])).view(np.int8)
+    boundaries = np.flatnonzero(np.diff(is_number))
+    # boundaries alternate between sequence starts and ends
+    non_nan_sequences = boundaries.reshape(-1, 2)
+    sequence_lengths = non_nan_sequences[:, 1] - non_nan_sequences[:, 0]
 
-    # which sequences contain NaNs
-    seq_is_nan = np.where(np.isnan(data[sequences[:, 0]]), False, True)
-    # remove sequences containing NaNs
-    non_nan_sequences = sequences[seq_is_nan == 1]
-    # split remaining sequences into filterable and short
-    filterable_sequences = non_nan_sequences[
-        (non_nan_sequences[:, 1] - non_nan_sequences[:, 0]) > min_signal_len
-    ]
-    short_sequences = non_nan_sequences[
-        (non_nan_sequences[:, 1] - non_nan_sequences[:, 0]) <= min_signal_len
-    ]
+    # split sequences into filterable and short
+    filterable_sequences = non_nan_sequences[sequence_lengths > min_signal_len]
+    short_sequences = non_nan_sequences[sequence_lengths <= min_signal_len]
 
     return filterable_sequences, short_sequences
 
@@ -233,6 +223,8 @@ def butterworth_lowpass(
     xy_filt = np.empty(xy.xy.shape)
     # loop through the xy-object columns
     for i, column in enumerate(np.transpose(xy.xy)):
+        # convert possible None-types in data to np.NaN
+        column = np.asarray(column, dtype=float)
         # extract indices of filterable and short sequences
         seqs_filt, seqs_short = _get_filterable_and_short_sequences(
             column, min_signal_len
@@ -170,3 +170,57 @@ def eigd_sample_data_floodlight_shape() -> np.ndarray:
 def filepath_empty() -> str:
     path = ".data\\EMPTY"
     return path
+
+
+# Kinexon mock data with three sensors in two groups over four frames at 10 Hz, where
+# some coordinates are missing and two records share a sensor and frame
+KINEXON_COLUMNS = (
+    "ts in ms",
+    "sensor id",
+    "mapped id",
+    "full name",
+    "group id",
+    "group name",
+    "x in m",
+    "y in m",
+    "z in m",
+)
+KINEXON_RECORDS = (
+    ("1000", "7", "21", "Zoe", "1", "Team B", "1.0", "2.0", "0"),
+    ("1000", "3", "12", "Bob", "1", "Team B", "3.0", "4.0", "0"),
+    ("1000", "5", "13", "Carol", "2", "Team A", "5.0", "6.0", "0"),
+    ("1100", "7", "21", "Zoe", "1", "Team B", "1.5", "", "0"),
+    ("1100", "5", "13", "Carol", "2", "Team A", "", "6.5", "0"),
+    ("1200", "3", "12", "Bob", "1", "Team B", "3.2", "4.2", "0"),
+    ("1200", "3", "12", "Bob", "1", "Team B", "3.4", "4.4", "0"),
+    ("1200", "7", "21", "Zoe", "1", "Team B", "1.7", "2.7", "0"),
+    ("1300", "7", "21", "Zoe", "1", "Team B", "1.9", "2.9", "0"),
+    ("1300", "7", "21", "Zoe", "1", "Team B", "", "3.0", "0"),
+)
+
+
+def _write_kinexon_csv(filepath, columns) -> str:
+    indices = [KINEXON_COLUMNS.index(column) for column in columns]
+    lines = [",".join(columns)]
+    lines.extend(",".join(record[i] for i in indices) for record in KINEXON_RECORDS)
+    filepath.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(filepath)
+
+
+@pytest.fixture()
+def filepath_kinexon_groups(tmp_path) -> str:
+    return _write_kinexon_csv(tmp_path / "kinexon.csv", KINEXON_COLUMNS)
+
+
+@pytest.fixture()
+def filepath_kinexon_group_id(tmp_path) -> str:
+    columns = tuple(column for column in KINEXON_COLUMNS if column != "group name")
+    return _write_kinexon_csv(tmp_path / "kinexon.csv", columns)
+
+
+@pytest.fixture()
+def filepath_kinexon_no_groups(tmp_path) -> str:
+    columns = tuple(
+        column for column in KINEXON_COLUMNS if column not in ("group id", "group name")
+    )
+    return _write_kinexon_csv(tmp_path / "kinexon.csv", columns)
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import numpy as np
 
@@ -20,11 +22,24 @@ def test_eigd_transform(
     )
 
 
+# StatsBombDataset and teamsheets for one sample match, shared within this module
+@pytest.fixture(scope="module")
+def statsbomb_acmilan_liverpool():
+    dataset = StatsBombOpenDataset()
+    teamsheets = dataset.get_teamsheets(
+        "Champions League",
+        "2004/2005",
+        "AC Milan vs. Liverpool",
+    )
+    return dataset, teamsheets
+
+
 # Test get method from StatsBombDataset
 @pytest.mark.unit
-def test_statsbomb_get() -> None:
+@pytest.mark.network
+def test_statsbomb_get(statsbomb_acmilan_liverpool) -> None:
 
-    dataset = StatsBombOpenDataset()
+    dataset, _ = statsbomb_acmilan_liverpool
     events, teamsheets = dataset.get(
         "Champions League",
         "2004/2005",
@@ -38,14 +53,10 @@ def test_statsbomb_get() -> None:
 
 # Test get_teamsheet method from StatsBombDataset
 @pytest.mark.unit
-def test_statsbomb_get_teamsheet() -> None:
+@pytest.mark.network
+def test_statsbomb_get_teamsheet(statsbomb_acmilan_liverpool) -> None:
 
-    dataset = StatsBombOpenDataset()
-    teamsheets = dataset.get_teamsheets(
-        "Champions League",
-        "2004/2005",
-        "AC Milan vs. Liverpool",
-    )
+    _, teamsheets = statsbomb_acmilan_liverpool
     assert isinstance(teamsheets["Home"], Teamsheet)
     assert isinstance(teamsheets["Away"], Teamsheet)
     assert teamsheets["Home"].teamsheet.at[0, "team_name"] == "AC Milan"
@@ -58,15 +69,12 @@ def test_statsbomb_get_teamsheet() -> None:
 
 # Test passing custom home_teamsheet to get method
 @pytest.mark.unit
-def test_statsbomb_get_pass_custom_home_teamsheet() -> None:
+@pytest.mark.network
+def test_statsbomb_get_pass_custom_home_teamsheet(statsbomb_acmilan_liverpool) -> None:
 
-    # get teamsheets
-    dataset = StatsBombOpenDataset()
-    teamsheets = dataset.get_teamsheets(
-        "Champions League",
-        "2004/2005",
-        "AC Milan vs. Liverpool",
-    )
+    # get copy of teamsheets
+    dataset, teamsheets = statsbomb_acmilan_liverpool
+    teamsheets = copy.deepcopy(teamsheets)
 
     # customize home teamsheet
     teamsheets["Home"].teamsheet.at[0, "player"] = "Dida"  # custom entry
@@ -90,14 +98,11 @@ def test_statsbomb_get_pass_custom_home_teamsheet() -> None:
 
 # Test passing custom away_teamsheet to get method
 @pytest.mark.unit
-def test_statsbomb_get_pass_custom_away_teamsheet() -> None:
-    # get teamsheets
-    dataset = StatsBombOpenDataset()
-    teamsheets = dataset.get_teamsheets(
-        "Champions League",
-        "2004/2005",
-        "AC Milan vs. Liverpool",
-    )
+@pytest.mark.network
+def test_statsbomb_get_pass_custom_away_teamsheet(statsbomb_acmilan_liverpool) -> None:
+    # get copy of teamsheets
+    dataset, teamsheets = statsbomb_acmilan_liverpool
+    teamsheets = copy.deepcopy(teamsheets)
 
     # customize home teamsheet
     teamsheets["Home"].teamsheet.at[0, "player"] = "Dida"  # custom entry but not passed
@@ -121,14 +126,11 @@ def test_statsbomb_get_pass_custom_away_teamsheet() -> None:
 
 # Test passing custom away_teamsheet to get method
 @pytest.mark.unit
-def test_statsbomb_get_pass_custom_teamsheets() -> None:
-    # get teamsheets
-    dataset = StatsBombOpenDataset()
-    teamsheets = dataset.get_teamsheets(
-        "Champions League",
-        "2004/2005",
-        "AC Milan vs. Liverpool",
-    )
+@pytest.mark.network
+def test_statsbomb_get_pass_custom_teamsheets(statsbomb_acmilan_liverpool) -> None:
+    # get copy of teamsheets
+    dataset, teamsheets = statsbomb_acmilan_liverpool
+    teamsheets = copy.deepcopy(teamsheets)
 
     # customize home teamsheet
     teamsheets["Home"].teamsheet.at[0, "player"] = "Dida"  # custom entry
@@ -0,0 +1,144 @@
+import pytest
+import numpy as np
+
+from floodlight.io.kinexon import (
+    create_links_from_meta_data,
+    get_meta_data,
+    read_position_data_csv,
+)
+
+
+NAN = np.nan
+
+# pIDs per group in order of first appearance in the data
+EXPECTED_PID_DICT_GROUPS = {
+    "Team A": {"sensor_id": ["5"], "mapped_id": ["13"], "name": ["Carol"]},
+    "Team B": {
+        "sensor_id": ["7", "3"],
+        "mapped_id": ["21", "12"],
+        "name": ["Zoe", "Bob"],
+    },
+}
+EXPECTED_PID_DICT_NO_GROUPS = {
+    "0": {
+        "sensor_id": ["7", "3", "5"],
+        "mapped_id": ["21", "12", "13"],
+        "name": ["Zoe", "Bob", "Carol"],
+    },
+}
+
+# positions of Zoe and Bob (group "Team B" or group id "1")
+EXPECTED_XY_TEAM_B = np.array(
+    (
+        (1.0, 2.0, 3.0, 4.0),
+        (1.5, NAN, NAN, NAN),
+        (1.7, 2.7, 3.4, 4.4),
+        (1.9, 3.0, NAN, NAN),
+    ),
+    dtype=np.float64,
+)
+# positions of Carol (group "Team A" or group id "2")
+EXPECTED_XY_TEAM_A = np.array(
+    (
+        (5.0, 6.0),
+        (NAN, 6.5),
+        (NAN, NAN),
+        (NAN, NAN),
+    ),
+    dtype=np.float64,
+)
+# positions of Zoe, Bob and Carol in the dummy group "0"
+EXPECTED_XY_NO_GROUPS = np.hstack((EXPECTED_XY_TEAM_B, EXPECTED_XY_TEAM_A))
+
+
+@pytest.mark.unit
+def test_read_position_data_csv_group_name(filepath_kinexon_groups) -> None:
+    # Act
+    positions = read_position_data_csv(filepath_kinexon_groups)
+
+    # Assert
+    # group_name is favored over group_id, groups are sorted ("Team A", "Team B")
+    assert len(positions) == 2
+    np.testing.assert_array_equal(positions[0].xy, EXPECTED_XY_TEAM_A, strict=True)
+    np.testing.assert_array_equal(positions[1].xy, EXPECTED_XY_TEAM_B, strict=True)
+    assert all(xy.framerate == 10 for xy in positions)
+
+
+@pytest.mark.unit
+def test_read_position_data_csv_group_id(filepath_kinexon_group_id) -> None:
+    # Act
+    positions = read_position_data_csv(filepath_kinexon_group_id)
+
+    # Assert
+    # groups are sorted ("1", "2")
+    assert len(positions) == 2
+    np.testing.assert_array_equal(positions[0].xy, EXPECTED_XY_TEAM_B, strict=True)
+    np.testing.assert_array_equal(positions[1].xy, EXPECTED_XY_TEAM_A, strict=True)
+    assert all(xy.framerate == 10 for xy in positions)
+
+
+@pytest.mark.unit
+def test_read_position_data_csv_no_groups(filepath_kinexon_no_groups) -> None:
+    # Act
+    with pytest.warns(UserWarning, match="dummy group '0'"):
+        positions = read_position_data_csv(filepath_kinexon_no_groups)
+
+    # Assert
+    assert len(positions) == 1
+    np.testing.assert_array_equal(positions[0].xy, EXPECTED_XY_NO_GROUPS, strict=True)
+    assert positions[0].framerate == 10
+
+
+@pytest.mark.unit
+def test_get_meta_data_groups(filepath_kinexon_groups) -> None:
+    # Act
+    pID_dict, number_of_frames, framerate, t_null = get_meta_data(
+        filepath_kinexon_groups
+    )
+
+    # Assert
+    assert pID_dict == EXPECTED_PID_DICT_GROUPS
+    assert list(pID_dict) == ["Team A", "Team B"]
+    assert all(
+        type(pIDs) is list for group in pID_dict.values() for pIDs in group.values()
+    )
+    assert number_of_frames == 3
+    assert framerate == 10
+    assert t_null == 1000
+
+
+@pytest.mark.unit
+def test_get_meta_data_no_groups(filepath_kinexon_no_groups) -> None:
+    # Act
+    with pytest.warns(UserWarning, match="dummy group '0'"):
+        pID_dict, number_of_frames, framerate, t_null = get_meta_data(
+            filepath_kinexon_no_groups
+        )
+
+    # Assert
+    assert pID_dict == EXPECTED_PID_DICT_NO_GROUPS
+    assert all(type(pIDs) is list for pIDs in pID_dict["0"].values())
+    assert number_of_frames == 3
+    assert framerate == 10
+    assert t_null == 1000
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "identifier, expected_links",
+    [
+        (None, {"Team A": {"Carol": 0}, "Team B": {"Zoe": 0, "Bob": 1}}),
+        ("sensor_id", {"Team A": {"5": 0}, "Team B": {"7": 0, "3": 1}}),
+        ("mapped_id", {"Team A": {"13": 0}, "Team B": {"21": 0, "12": 1}}),
+    ],
+)
+def test_create_links_from_meta_data(identifier, expected_links) -> None:
+    # Act
+    links = create_links_from_meta_data(EXPECTED_PID_DICT_GROUPS, identifier)
+
+    # Assert
+    assert links == expected_links
+    assert list(links) == list(expected_links)
+    assert all(
+        list(links[group]) == list(expected_links[group]) for group in expected_links
+    )
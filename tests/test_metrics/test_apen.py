@@ -58,7 +58,7 @@ def test_approx_entropy_series_5(precision=0.1, reps=100) -> None:
     for  medical data analysis. Journal of clinical monitoring, 7(4), 335-345.
     """
     # signal consists of the consecutive pattern [1,2,3]
-    signal = np.tile([1, 2, 1, 3], reps)
+    signal = np.tile(np.array([1, 2, 1, 3], dtype=np.int8), reps)
     # should equal zero
     assert np.abs(approx_entropy(signal, m=1, r=0.5) - 0.5 * np.log(2.0)) < precision
     # should equal zero
@@ -71,5 +71,6 @@ def test_approx_entropy_series_7(precision=0.01, N=400) -> None:
     # signal consists of repeated [1,0] added with either 0.002 or -0.001
     # with selection probability p = 1/2.
     signal = np.random.choice([0.002, -0.001], N) + np.tile([1, 0], int(N / 2))
+    signal = signal.astype(np.float32)
     # should equal zero
     assert np.abs(approx_entropy(signal, m=2, r=0.5)) < precision
@@ -1,12 +1,16 @@
-from typing import Tuple
+from typing import Dict, Tuple
 
 import pytest
 import numpy as np
 
 from floodlight import Pitch, XY
+from floodlight.models.kinematics import DistanceModel, VelocityModel, AccelerationModel
+from floodlight.models.kinetics import MetabolicPowerModel
+from floodlight.models.space import DiscreteVoronoiModel
 
 
-@pytest.fixture()
+# sample data for testing kinetic models (shared, hence read-only)
+@pytest.fixture(scope="session")
 def example_xy_object_kinetics() -> XY:
     xy = XY(
         xy=np.array(
@@ -18,9 +22,18 @@ def example_xy_object_kinetics() -> XY:
         ),
         framerate=20,
     )
+    xy.xy.flags.writeable = False
     return xy
 
 
+# metabolic power model fitted once on sample data, shared as accessors only read
+@pytest.fixture(scope="session")
+def fitted_metp_model(example_xy_object_kinetics) -> MetabolicPowerModel:
+    model = MetabolicPowerModel()
+    model.fit(example_xy_object_kinetics)
+    return model
+
+
 # sample data for testing geometry models
 @pytest.fixture()
 def example_xy_object_geometry():
@@ -28,47 +41,171 @@ def example_xy_object_geometry():
     return xy
 
 
-# sample data for testing kinematic models
-@pytest.fixture()
+# sample data for testing kinematic models (shared, hence read-only)
+@pytest.fixture(scope="session")
 def example_xy_object_kinematics():
     xy = XY(
         xy=np.array(((0, 0, -1, 1), (0, 1, np.nan, np.nan), (1, 2, 1, -1))),
         framerate=20,
     )
+    xy.xy.flags.writeable = False
     return xy
 
 
-@pytest.fixture()
+# kinematic models fitted once on sample data, shared as accessors only read
+@pytest.fixture(scope="session")
+def fitted_distance_model_central(example_xy_object_kinematics) -> DistanceModel:
+    model = DistanceModel()
+    model.fit(example_xy_object_kinematics)
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_distance_model_backward(example_xy_object_kinematics) -> DistanceModel:
+    model = DistanceModel()
+    model.fit(example_xy_object_kinematics, difference="backward")
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_velocity_model_central(example_xy_object_kinematics) -> VelocityModel:
+    model = VelocityModel()
+    model.fit(example_xy_object_kinematics)
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_velocity_model_backward(example_xy_object_kinematics) -> VelocityModel:
+    model = VelocityModel()
+    model.fit(example_xy_object_kinematics, difference="backward")
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_acceleration_model_central(
+    example_xy_object_kinematics,
+) -> AccelerationModel:
+    model = AccelerationModel()
+    model.fit(example_xy_object_kinematics)
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_acceleration_model_backward(
+    example_xy_object_kinematics,
+) -> AccelerationModel:
+    model = AccelerationModel()
+    model.fit(example_xy_object_kinematics, difference="backward")
+    return model
+
+
+# sample inputs for MetabolicPowerModel staticmethods, shared and hence read-only
+@pytest.fixture(scope="session")
 def example_equivalent_slope() -> np.ndarray:
     equivalent_slope = np.array(((0, 0.15), (-0.11, 0.2), (0.5, -0.5)))
+    equivalent_slope.flags.writeable = False
     return equivalent_slope
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def example_velocity() -> np.ndarray:
     velocity = np.array(((1, 0.1), (2.8, 5), (2.3, 2.3)))
+    velocity.flags.writeable = False
     return velocity
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def example_acceleration() -> np.ndarray:
     acceleration = np.array(((1.8, 4.9), (0.65, 1.1), (-0.5, -2.7)))
+    acceleration.flags.writeable = False
     return acceleration
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def example_equivalent_mass() -> np.ndarray:
     equivalent_mass = np.array(((1, 1.011), (1.006, 1.02), (1.118, 1.118)))
+    equivalent_mass.flags.writeable = False
     return equivalent_mass
 
 
-@pytest.fixture()
+# tiled versions of the sample inputs for testing on larger arrays
+@pytest.fixture(scope="session")
+def example_equivalent_slope_large(example_equivalent_slope) -> np.ndarray:
+    equivalent_slope = np.tile(example_equivalent_slope, (100, 1))
+    equivalent_slope.flags.writeable = False
+    return equivalent_slope
+
+
+@pytest.fixture(scope="session")
+def example_velocity_large(example_velocity) -> np.ndarray:
+    velocity = np.tile(example_velocity, (100, 1))
+    velocity.flags.writeable = False
+    return velocity
+
+
+@pytest.fixture(scope="session")
+def example_equivalent_mass_large(example_equivalent_mass) -> np.ndarray:
+    equivalent_mass = np.tile(example_equivalent_mass, (100, 1))
+    equivalent_mass.flags.writeable = False
+    return equivalent_mass
+
+
+@pytest.fixture(scope="session")
+def example_acceleration_large(example_acceleration) -> np.ndarray:
+    acceleration = np.tile(example_acceleration, (100, 1))
+    acceleration.flags.writeable = False
+    return acceleration
+
+
+# sample inputs for MetabolicPowerModel staticmethods, keyed by argument names
+@pytest.fixture(scope="session")
+def kinetics_inputs(
+    example_equivalent_slope,
+    example_velocity,
+    example_acceleration,
+    example_equivalent_mass,
+) -> Dict[str, np.ndarray]:
+    return {
+        "es": example_equivalent_slope,
+        "vel": example_velocity,
+        "acc": example_acceleration,
+        "em": example_equivalent_mass,
+    }
+
+
+@pytest.fixture(scope="session")
+def kinetics_inputs_large(
+    example_equivalent_slope_large,
+    example_velocity_large,
+    example_acceleration_large,
+    example_equivalent_mass_large,
+) -> Dict[str, np.ndarray]:
+    return {
+        "es": example_equivalent_slope_large,
+        "vel": example_velocity_large,
+        "acc": example_acceleration_large,
+        "em": example_equivalent_mass_large,
+    }
+
+
+@pytest.fixture(scope="session")
 def example_pitch_dfl():
     pitch = Pitch.from_template("dfl", length=100, width=50, sport="football")
     return pitch
 
 
-@pytest.fixture()
+# pitches of all templates in the same real-world size for testing mesh generation
+@pytest.fixture(scope="session")
+def pitches_109x69() -> Dict[str, Pitch]:
+    templates = ("opta", "statsbomb", "dfl", "tracab", "statsperform_tracking")
+    pitches = {
+        template: Pitch.from_template(template, sport="football", length=109, width=69)
+        for template in templates
+    }
+    return pitches
+
+
+@pytest.fixture(scope="session")
 def example_xy_objects_space_control() -> Tuple[XY, XY]:
     xy1 = XY(
         xy=np.array(
@@ -90,3 +227,22 @@ def example_xy_objects_space_control() -> Tuple[XY, XY]:
     )
 
     return xy1, xy2
+
+
+# space control models fitted once on sample data, shared as accessors only read
+@pytest.fixture(scope="session")
+def fitted_dvm_square(
+    example_xy_objects_space_control, example_pitch_dfl
+) -> DiscreteVoronoiModel:
+    model = DiscreteVoronoiModel(example_pitch_dfl, mesh="square", xpoints=10)
+    model.fit(*example_xy_objects_space_control)
+    return model
+
+
+@pytest.fixture(scope="session")
+def fitted_dvm_hex(
+    example_xy_objects_space_control, example_pitch_dfl
+) -> DiscreteVoronoiModel:
+    model = DiscreteVoronoiModel(example_pitch_dfl, mesh="hexagonal", xpoints=10)
+    model.fit(*example_xy_objects_space_control)
+    return model
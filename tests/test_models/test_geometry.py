@@ -56,9 +56,11 @@ def test_centroid_distance(example_xy_object_geometry) -> None:
     distance = model.centroid_distance(xy)
 
     # Assert
-    assert np.array_equal(
-        np.round(distance, 3),
+    np.testing.assert_allclose(
+        distance,
         np.array(((2.062, 1.118, np.nan), (np.nan, np.nan, 0.559))),
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
@@ -78,7 +80,11 @@ def test_stretch_index(example_xy_object_geometry) -> None:
     stretch_index3 = model.stretch_index(xy, axis="y")
 
     # Assert
-    assert np.array_equal(np.round(stretch_index1, 3), np.array((1.59, 0.559)))
-    assert np.array_equal(np.round(stretch_index2, 3), np.array((0.5, 0.25)))
-    assert np.array_equal(np.round(stretch_index3, 3), np.array((1.333, 0.5)))
+    np.testing.assert_allclose(
+        stretch_index1, np.array((1.59, 0.559)), rtol=0, atol=5e-4
+    )
+    np.testing.assert_allclose(stretch_index2, np.array((0.5, 0.25)), rtol=0, atol=5e-4)
+    np.testing.assert_allclose(
+        stretch_index3, np.array((1.333, 0.5)), rtol=0, atol=5e-4
+    )
     assert stretch_index1.framerate == 20
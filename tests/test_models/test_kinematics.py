@@ -1,7 +1,33 @@
 import pytest
 import numpy as np
 
-from floodlight.models.kinematics import DistanceModel, VelocityModel, AccelerationModel
+
+pytestmark = pytest.mark.unit
+
+
+NAN = np.nan
+
+EXPECTED_DISTANCE_MODEL_FIT_DIFFERENCE_CENTRAL = np.array(
+    ((1, NAN), (1.118, 1.414), (1.414, NAN)), dtype=np.float64
+)
+EXPECTED_DISTANCE_MODEL_FIT_DIFFERENCE_BACKWARD = np.array(
+    ((0, 0), (1, NAN), (1.414, NAN)), dtype=np.float64
+)
+EXPECTED_CUMULATIVE_DISTANCE_COVERED = np.array(
+    ((1, 0), (2.118, 1.414), (3.532, 1.414)), dtype=np.float64
+)
+EXPECTED_VELOCITY_MODEL_FIT_DIFFERENCE_CENTRAL = np.array(
+    ((20, NAN), (22.361, 28.284), (28.284, NAN)), dtype=np.float64
+)
+EXPECTED_VELOCITY_MODEL_FIT_DIFFERENCE_BACKWARD = np.array(
+    ((0, 0), (20, NAN), (28.284, NAN)), dtype=np.float64
+)
+EXPECTED_ACCELERATION_MODEL_DIFFERENCE_CENTRAL = np.array(
+    ((47.214, NAN), (82.843, NAN), (118.472, NAN)), dtype=np.float64
+)
+EXPECTED_ACCELERATION_MODEL_DIFFERENCE_BACKWARD = np.array(
+    ((0, 0), (400, NAN), (165.685, NAN)), dtype=np.float64
+)
 
 
 # Differences in the kinematic models can be calculated via central or backward
@@ -11,181 +37,123 @@ from floodlight.models.kinematics import DistanceModel, VelocityModel, Accelerat
 # tested with the default difference methode (i.e., 'central').
 
 
-@pytest.mark.unit
-def test_distance_model_fit_difference_central(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_distance_model_fit_difference_central(fitted_distance_model_central) -> None:
     # Act
-    dist_model = DistanceModel()
-    dist_model.fit(xy)
-    distance_covered = dist_model._distance_euclidean_
+    distance_covered = fitted_distance_model_central._distance_euclidean_
 
     # Assert
-    assert np.array_equal(
-        np.round(distance_covered, 3),
-        np.array(((1, np.nan), (1.118, 1.414), (1.414, np.nan))),
+    np.testing.assert_allclose(
+        distance_covered,
+        EXPECTED_DISTANCE_MODEL_FIT_DIFFERENCE_CENTRAL,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_distance_model_fit_difference_backward(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_distance_model_fit_difference_backward(fitted_distance_model_backward) -> None:
     # Act
-    dist_model = DistanceModel()
-    dist_model.fit(xy, difference="backward")
-    distance_covered = dist_model._distance_euclidean_
+    distance_covered = fitted_distance_model_backward._distance_euclidean_
 
     # Assert
-    assert np.array_equal(
-        np.round(distance_covered, 3),
-        np.array(((0, 0), (1, np.nan), (1.414, np.nan))),
+    np.testing.assert_allclose(
+        distance_covered,
+        EXPECTED_DISTANCE_MODEL_FIT_DIFFERENCE_BACKWARD,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_distance_covered(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_cumulative_distance_covered(fitted_distance_model_central) -> None:
     # Act
-    dist_model = DistanceModel()
-    dist_model.fit(xy)
-    distance_covered = dist_model.distance_covered()
+    distance_covered = fitted_distance_model_central.cumulative_distance_covered()
 
     # Assert
-    assert np.array_equal(
-        np.round(distance_covered, 3),
-        np.array(((1, np.nan), (1.118, 1.414), (1.414, np.nan))),
+    np.testing.assert_allclose(
+        distance_covered,
+        EXPECTED_CUMULATIVE_DISTANCE_COVERED,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_cumulative_distance_covered(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_velocity_model_fit_difference_central(fitted_velocity_model_central) -> None:
     # Act
-    dist_model = DistanceModel()
-    dist_model.fit(xy)
-    distance_covered = dist_model.cumulative_distance_covered()
+    velocity = fitted_velocity_model_central._velocity_
 
     # Assert
-    assert np.array_equal(
-        np.round(distance_covered, 3),
-        np.array(((1, 0), (2.118, 1.414), (3.532, 1.414))),
+    np.testing.assert_allclose(
+        velocity,
+        EXPECTED_VELOCITY_MODEL_FIT_DIFFERENCE_CENTRAL,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_velocity_model_fit_difference_central(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_velocity_model_fit_difference_backward(fitted_velocity_model_backward) -> None:
     # Act
-    vel_model = VelocityModel()
-    vel_model.fit(xy)
-    velocity = vel_model._velocity_
+    velocity = fitted_velocity_model_backward._velocity_
 
     # Assert
-    assert np.array_equal(
-        np.round(velocity, 3),
-        np.array(((20, np.nan), (22.361, 28.284), (28.284, np.nan))),
+    np.testing.assert_allclose(
+        velocity,
+        EXPECTED_VELOCITY_MODEL_FIT_DIFFERENCE_BACKWARD,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_velocity_model_fit_difference_backward(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_acceleration_model_difference_central(
+    fitted_acceleration_model_central,
+) -> None:
     # Act
-    vel_model = VelocityModel()
-    vel_model.fit(xy, difference="backward")
-    velocity = vel_model._velocity_
+    acceleration = fitted_acceleration_model_central._acceleration_
 
     # Assert
-    assert np.array_equal(
-        np.round(velocity, 3),
-        np.array(((0, 0), (20, np.nan), (28.284, np.nan))),
+    np.testing.assert_allclose(
+        acceleration,
+        EXPECTED_ACCELERATION_MODEL_DIFFERENCE_CENTRAL,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_velocity(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
+def test_acceleration_model_difference_backward(
+    fitted_acceleration_model_backward,
+) -> None:
     # Act
-    vel_model = VelocityModel()
-    vel_model.fit(xy)
-    velocity = vel_model.velocity()
+    acceleration = fitted_acceleration_model_backward._acceleration_
 
     # Assert
-    assert np.array_equal(
-        np.round(velocity, 3),
-        np.array(((20, np.nan), (22.361, 28.284), (28.284, np.nan))),
+    np.testing.assert_allclose(
+        acceleration,
+        EXPECTED_ACCELERATION_MODEL_DIFFERENCE_BACKWARD,
+        rtol=0,
+        atol=5e-4,
         equal_nan=True,
     )
 
 
-@pytest.mark.unit
-def test_acceleration_model_difference_central(example_xy_object_kinematics) -> None:
+# Accessors return the fitted properties as they are, hence their values are covered by
+# the .fit()-method tests above
+@pytest.mark.parametrize(
+    "fitted_model, accessor, attribute",
+    [
+        ("fitted_distance_model_central", "distance_covered", "_distance_euclidean_"),
+        ("fitted_velocity_model_central", "velocity", "_velocity_"),
+        ("fitted_acceleration_model_central", "acceleration", "_acceleration_"),
+    ],
+)
+def test_accessors_return_fitted_property(
+    request, fitted_model, accessor, attribute
+) -> None:
     # Arrange
-    xy = example_xy_object_kinematics
-
-    # Act
-    acc_model = AccelerationModel()
-    acc_model.fit(xy)
-    acceleration = acc_model._acceleration_
+    model = request.getfixturevalue(fitted_model)
 
     # Assert
-    assert np.array_equal(
-        np.round(acceleration, 3),
-        np.array(((47.214, np.nan), (82.843, np.nan), (118.472, np.nan))),
-        equal_nan=True,
-    )
-
-
-@pytest.mark.unit
-def test_acceleration_model_difference_backward(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
-    # Act
-    acc_model = AccelerationModel()
-    acc_model.fit(xy, difference="backward")
-    acceleration = acc_model._acceleration_
-
-    # Assert
-    assert np.array_equal(
-        np.round(acceleration, 3),
-        np.array(((0, 0), (400, np.nan), (165.685, np.nan))),
-        equal_nan=True,
-    )
-
-
-@pytest.mark.unit
-def test_acceleration(example_xy_object_kinematics) -> None:
-    # Arrange
-    xy = example_xy_object_kinematics
-
-    # Act
-    acc_model = AccelerationModel()
-    acc_model.fit(xy)
-    acceleration = acc_model.acceleration()
-
-    # Assert
-    assert np.array_equal(
-        np.round(acceleration, 3),
-        np.array(((47.214, np.nan), (82.843, np.nan), (118.472, np.nan))),
-        equal_nan=True,
-    )
+    assert getattr(model, accessor)() is getattr(model, attribute)
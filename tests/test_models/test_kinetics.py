@@ -4,229 +4,193 @@ import numpy as np
 from floodlight.models.kinetics import MetabolicPowerModel
 
 
-@pytest.mark.unit
-def test_calc_es(example_velocity, example_acceleration) -> None:
-    # Arrange
-    velocity = example_velocity
-    acceleration = example_acceleration
-
-    # Act
-    equivalent_slope = MetabolicPowerModel._calc_es(velocity, acceleration)
-
-    # Assert
-    assert np.array_equal(
-        np.round(equivalent_slope, 3),
-        np.array(((0.184, 0.5), (0.069, 0.122), (-0.049, -0.273))),
-    )
-
-
-@pytest.mark.unit
-def test_calc_em(example_equivalent_slope) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-
-    # Act
-    equivalent_mass = MetabolicPowerModel._calc_em(equivalent_slope)
-
-    # Assert
-    assert np.array_equal(
-        np.round(equivalent_mass, 3),
-        np.array(((1, 1.011), (1.006, 1.02), (1.118, 1.118))),
-    )
-
-
-@pytest.mark.unit
-def test_calc_v_trans(example_equivalent_slope) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-
+pytestmark = pytest.mark.unit
+
+
+EXPECTED_CALC_ES = np.array(
+    ((0.184, 0.5), (0.069, 0.122), (-0.049, -0.273)), dtype=np.float64
+)
+EXPECTED_CALC_EM = np.array(
+    ((1, 1.011), (1.006, 1.02), (1.118, 1.118)), dtype=np.float64
+)
+EXPECTED_CALC_V_TRANS = np.array(
+    ((2.27, 1.704), (2.285, 1.434), (1.044, 9.717)), dtype=np.float64
+)
+EXPECTED_IS_RUNNING = np.array(
+    ((False, False), (True, True), (True, False)), dtype=bool
+)
+EXPECTED_GET_INTERPOLATION_MATRIX = np.array(
+    (
+        ([0, 0, 0, 1, 0, 0, 0, 0], [0, 0, 0, 0, 0.5, 0.5, 0, 0]),
+        ([0, 0.1, 0.9, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 1, 0, 0]),
+        ([0, 0, 0, 0, 0, 0, 0, 1], [1, 0, 0, 0, 0, 0, 0, 0]),
+    ),
+    dtype=np.float64,
+)
+EXPECTED_CALC_ECW = np.array(
+    ((2.02, 8.962), (6.746, 1043.807), (992.779, 3.013)), dtype=np.float64
+)
+EXPECTED_CALC_ECR = np.array(
+    ((3.6, 7.988), (1.79, 9.708), (22.625, 4.668)), dtype=np.float64
+)
+EXPECTED_CALC_ECL = np.array(
+    ((2.02, 8.962), (1.79, 9.708), (22.625, 3.013)), dtype=np.float64
+)
+EXPECTED_CALC_METABOLIC_POWER = np.array(
+    ((2.020, 0.896), (5.011, 48.540), (52.038, 6.931)), dtype=np.float64
+)
+EXPECTED_METABOLIC_POWER = np.array(
+    ((9.177, 4.452), (9.306, 4.988), (9.439, 5.570)), dtype=np.float64
+)
+EXPECTED_CUMULATIVE_METABOLIC_POWER = np.array(
+    ((0.459, 0.223), (0.924, 0.472), (1.396, 0.751)), dtype=np.float64
+)
+EXPECTED_EQUIVALENT_DISTANCE = np.array(
+    ((2.549, 1.237), (2.585, 1.386), (2.622, 1.547)), dtype=np.float64
+)
+EXPECTED_CUMULATIVE_EQUIVALENT_DISTANCE = np.array(
+    ((0.127, 0.062), (0.257, 0.131), (0.388, 0.208)), dtype=np.float64
+)
+
+
+# Test staticmethods of MetabolicPowerModel with numeric results
+@pytest.mark.parametrize(
+    "method, arg_names, expected",
+    [
+        pytest.param("_calc_es", ("vel", "acc"), EXPECTED_CALC_ES, id="calc_es"),
+        pytest.param("_calc_em", ("es",), EXPECTED_CALC_EM, id="calc_em"),
+        pytest.param(
+            "_calc_v_trans", ("es",), EXPECTED_CALC_V_TRANS, id="calc_v_trans"
+        ),
+        pytest.param(
+            "_get_interpolation_weight_matrix",
+            ("es",),
+            EXPECTED_GET_INTERPOLATION_MATRIX,
+            id="get_interpolation_matrix",
+        ),
+        pytest.param(
+            "_calc_ecw", ("es", "vel", "em"), EXPECTED_CALC_ECW, id="calc_ecw"
+        ),
+        pytest.param("_calc_ecr", ("es", "em"), EXPECTED_CALC_ECR, id="calc_ecr"),
+        pytest.param(
+            "_calc_ecl", ("es", "vel", "em"), EXPECTED_CALC_ECL, id="calc_ecl"
+        ),
+    ],
+)
+def test_staticmethods(kinetics_inputs, method, arg_names, expected) -> None:
     # Act
-    v_trans = MetabolicPowerModel._calc_v_trans(equivalent_slope)
-
-    # Assert
-    assert np.array_equal(
-        np.round(v_trans, 3), np.array(((2.27, 1.704), (2.285, 1.434), (1.044, 9.717)))
+    result = getattr(MetabolicPowerModel, method)(
+        *[kinetics_inputs[name] for name in arg_names]
     )
 
-
-@pytest.mark.unit
-def test_is_running(example_velocity, example_equivalent_slope) -> None:
-    # Arrange
-    velocity = example_velocity
-    equivalent_slope = example_equivalent_slope
-
-    # Act
-    is_running = MetabolicPowerModel._is_running(velocity, equivalent_slope)
-
     # Assert
-    assert np.array_equal(
-        is_running, np.array(((False, False), (True, True), (True, False)))
-    )
-
-
-@pytest.mark.unit
-def test_get_interpolation_matrix(example_equivalent_slope) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-
-    # Act
-    W = MetabolicPowerModel._get_interpolation_weight_matrix(equivalent_slope)
-
-    # Assert
-    assert np.array_equal(
-        np.round(W, 3),
-        np.array(
-            (
-                ([0, 0, 0, 1, 0, 0, 0, 0], [0, 0, 0, 0, 0.5, 0.5, 0, 0]),
-                ([0, 0.1, 0.9, 0, 0, 0, 0, 0], [0, 0, 0, 0, 0, 1, 0, 0]),
-                ([0, 0, 0, 0, 0, 0, 0, 1], [1, 0, 0, 0, 0, 0, 0, 0]),
-            )
+    np.testing.assert_allclose(result, expected, rtol=0, atol=5e-4)
+
+
+# Test staticmethods of MetabolicPowerModel on larger inputs
+@pytest.mark.parametrize(
+    "method, arg_names, expected_shape",
+    [
+        pytest.param("_calc_es", ("vel", "acc"), (300, 2), id="calc_es"),
+        pytest.param("_calc_em", ("es",), (300, 2), id="calc_em"),
+        pytest.param("_calc_v_trans", ("es",), (300, 2), id="calc_v_trans"),
+        pytest.param("_is_running", ("vel", "es"), (300, 2), id="is_running"),
+        pytest.param(
+            "_get_interpolation_weight_matrix",
+            ("es",),
+            (300, 2, 8),
+            id="get_interpolation_matrix",
         ),
-    )
-
-
-@pytest.mark.unit
-def test_calc_ecw(
-    example_equivalent_slope, example_velocity, example_equivalent_mass
+        pytest.param("_calc_ecw", ("es", "vel", "em"), (300, 2), id="calc_ecw"),
+        pytest.param("_calc_ecr", ("es", "em"), (300, 2), id="calc_ecr"),
+        pytest.param("_calc_ecl", ("es", "vel", "em"), (300, 2), id="calc_ecl"),
+    ],
+)
+def test_staticmethods_large(
+    kinetics_inputs_large, method, arg_names, expected_shape
 ) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-    velocity = example_velocity
-    equivalent_mass = example_equivalent_mass
-
     # Act
-    ecw = MetabolicPowerModel._calc_ecw(equivalent_slope, velocity, equivalent_mass)
-
-    # Assert
-    assert np.array_equal(
-        np.round(ecw, 3), np.array(((2.02, 8.962), (6.746, 1043.807), (992.779, 3.013)))
+    result = getattr(MetabolicPowerModel, method)(
+        *[kinetics_inputs_large[name] for name in arg_names]
     )
 
-
-@pytest.mark.unit
-def test_calc_ecr(example_equivalent_slope, example_equivalent_mass) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-    equivalent_mass = example_equivalent_mass
-
-    # Act
-    ecr = MetabolicPowerModel._calc_ecr(equivalent_slope, equivalent_mass)
-
     # Assert
-    assert np.array_equal(
-        np.round(ecr, 3), np.array(((3.6, 7.988), (1.79, 9.708), (22.625, 4.668)))
-    )
-
+    assert result.shape == expected_shape
+    assert np.all(np.isfinite(result))
 
-@pytest.mark.unit
-def test_calc_ecl(
-    example_equivalent_slope, example_velocity, example_equivalent_mass
-) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-    velocity = example_velocity
-    equivalent_mass = example_equivalent_mass
 
+def test_is_running(kinetics_inputs) -> None:
     # Act
-    ecl = MetabolicPowerModel._calc_ecl(equivalent_slope, velocity, equivalent_mass)
-
-    # Assert
-    assert np.array_equal(
-        np.round(ecl, 3), np.array(((2.02, 8.962), (1.79, 9.708), (22.625, 3.013)))
+    is_running = MetabolicPowerModel._is_running(
+        kinetics_inputs["vel"], kinetics_inputs["es"]
     )
 
+    # Assert
+    np.testing.assert_array_equal(is_running, EXPECTED_IS_RUNNING, strict=True)
 
-@pytest.mark.unit
-def test_calc_metabolic_power(
-    example_equivalent_slope,
-    example_velocity,
-    example_equivalent_mass,
-) -> None:
-    # Arrange
-    equivalent_slope = example_equivalent_slope
-    velocity = example_velocity
-    equivalent_mass = example_equivalent_mass
-    framerate = 20
 
+def test_calc_metabolic_power(kinetics_inputs) -> None:
     # Act
     metabolic_power = MetabolicPowerModel._calc_metabolic_power(
-        equivalent_slope, velocity, equivalent_mass, framerate
+        kinetics_inputs["es"], kinetics_inputs["vel"], kinetics_inputs["em"], 20
     )
 
     # Assert
-    assert np.array_equal(
-        np.round(metabolic_power, 3),
-        np.array(((2.020, 0.896), (5.011, 48.540), (52.038, 6.931))),
+    np.testing.assert_allclose(
+        metabolic_power,
+        EXPECTED_CALC_METABOLIC_POWER,
+        rtol=0,
+        atol=5e-4,
     )
 
 
-@pytest.mark.unit
-def test_metabolic_power(example_pitch_dfl, example_xy_object_kinetics) -> None:
-    # Arrange
-    xy = example_xy_object_kinetics
-
+def test_metabolic_power(fitted_metp_model) -> None:
     # Act
-    metp_model = MetabolicPowerModel()
-    metp_model.fit(xy)
-    metabolic_power = metp_model.metabolic_power()
+    metabolic_power = fitted_metp_model.metabolic_power()
 
     # Assert
-    assert np.array_equal(
-        np.round(metabolic_power, 3),
-        np.array(((9.177, 4.452), (9.306, 4.988), (9.439, 5.570))),
+    np.testing.assert_allclose(
+        metabolic_power,
+        EXPECTED_METABOLIC_POWER,
+        rtol=0,
+        atol=5e-4,
     )
 
 
-@pytest.mark.unit
-def test_cumulative_metabolic_power(
-    example_pitch_dfl, example_xy_object_kinetics
-) -> None:
-    # Arrange
-    xy = example_xy_object_kinetics
-
+def test_cumulative_metabolic_power(fitted_metp_model) -> None:
     # Act
-    metp_model = MetabolicPowerModel()
-    metp_model.fit(xy)
-    cumulative_metabolic_power = metp_model.cumulative_metabolic_power()
+    cumulative_metabolic_power = fitted_metp_model.cumulative_metabolic_power()
 
     # Assert
-    assert np.array_equal(
-        np.round(cumulative_metabolic_power, 3),
-        np.array(((0.459, 0.223), (0.924, 0.472), (1.396, 0.751))),
+    np.testing.assert_allclose(
+        cumulative_metabolic_power,
+        EXPECTED_CUMULATIVE_METABOLIC_POWER,
+        rtol=0,
+        atol=5e-4,
     )
 
 
-@pytest.mark.unit
-def test_equivalent_distance(example_pitch_dfl, example_xy_object_kinetics) -> None:
-    # Arrange
-    xy = example_xy_object_kinetics
-
+def test_equivalent_distance(fitted_metp_model) -> None:
     # Act
-    metp_model = MetabolicPowerModel()
-    metp_model.fit(xy)
-    equivalent_distance = metp_model.equivalent_distance()
+    equivalent_distance = fitted_metp_model.equivalent_distance()
 
     # Assert
-    assert np.array_equal(
-        np.round(equivalent_distance, 3),
-        np.array(((2.549, 1.237), (2.585, 1.386), (2.622, 1.547))),
+    np.testing.assert_allclose(
+        equivalent_distance,
+        EXPECTED_EQUIVALENT_DISTANCE,
+        rtol=0,
+        atol=5e-4,
     )
 
 
-@pytest.mark.unit
-def test_cumulative_equivalent_distance(
-    example_pitch_dfl, example_xy_object_kinetics
-) -> None:
-    # Arrange
-    xy = example_xy_object_kinetics
-
+def test_cumulative_equivalent_distance(fitted_metp_model) -> None:
     # Act
-    metp_model = MetabolicPowerModel()
-    metp_model.fit(xy)
-    cumulative_equivalent_distance = metp_model.cumulative_equivalent_distance()
+    cumulative_equivalent_distance = fitted_metp_model.cumulative_equivalent_distance()
 
     # Assert
-    assert np.array_equal(
-        np.round(cumulative_equivalent_distance, 3),
-        np.array(((0.127, 0.062), (0.257, 0.131), (0.388, 0.208))),
+    np.testing.assert_allclose(
+        cumulative_equivalent_distance,
+        EXPECTED_CUMULATIVE_EQUIVALENT_DISTANCE,
+        rtol=0,
+        atol=5e-4,
     )
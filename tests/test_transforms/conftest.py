@@ -3,11 +3,52 @@ import numpy as np
 from floodlight import XY
 
 
+# sample data is built once at import, fixtures hand out copies
+# missing data may be given as np.nan or None, hence the object dtype
+EXAMPLE_SEQUENCE = np.array(
+    [np.nan, np.nan, -5.07, -2.7, -3, np.nan, np.nan, 1.53, 27.13, None, 30.06],
+    dtype=object,
+)
+EXAMPLE_SEQUENCE_FULL = np.array([-5.07, -2.7, 1.53, 27.13, 30.06], dtype=np.float64)
+EXAMPLE_SEQUENCE_NAN = np.full(5, np.nan, dtype=np.float64)
+EXAMPLE_XY_FILTER = np.array(
+    [
+        [np.nan, -8.66, np.nan, 1],
+        [np.nan, -6.29, np.nan, 2],
+        [-5.07, -4.31, np.nan, 3],
+        [-2.7, -1.95, np.nan, 4],
+        [np.nan, -0.13, np.nan, 5],
+        [np.nan, 2.31, np.nan, 6],
+        [1.53, 3.74, np.nan, 7],
+        [5.13, 6.53, np.nan, 8],
+        [7.02, 8.07, np.nan, 9],
+        [9.48, 10.53, np.nan, 8],
+        [10.09, np.nan, np.nan, 7],
+        [12.31, np.nan, np.nan, 6],
+        [13.22, np.nan, np.nan, 5],
+        [14.88, 14.88, np.nan, 4],
+        [16.23, 17.05, np.nan, 3],
+        [17.06, 18.37, np.nan, 2],
+        [18.56, 19.27, np.nan, 1],
+        [20.32, 20.46, np.nan, 2],
+        [21.7, 22.61, np.nan, 3],
+        [23.11, 23.54, np.nan, 4],
+        [24.23, 25.25, np.nan, 5],
+        [25.74, 25.95, np.nan, 6],
+        [27.13, 28.06, np.nan, 7],
+        [np.nan, 29.55, np.nan, 8],
+        [30.06, np.nan, np.nan, 9],
+    ],
+    dtype=np.float64,
+)
+# same data with one missing value given as None
+EXAMPLE_XY_FILTER_WITH_NONE = EXAMPLE_XY_FILTER.astype(object)
+EXAMPLE_XY_FILTER_WITH_NONE[23, 0] = None
+
+
 @pytest.fixture()
 def example_sequence():
-    seq = np.array(
-        [np.nan, np.nan, -5.07, -2.7, -3, np.nan, np.nan, 1.53, 27.13, None, 30.06]
-    )
+    seq = EXAMPLE_SEQUENCE.copy()
     return seq
 
 
@@ -25,68 +66,47 @@ def example_sequence_two_dimensional():
 
 @pytest.fixture()
 def example_sequence_full():
-    seq = np.array([-5.07, -2.7, 1.53, 27.13, 30.06])
+    seq = EXAMPLE_SEQUENCE_FULL.copy()
     return seq
 
 
 @pytest.fixture()
 def example_sequence_nan():
-    seq = np.array([np.nan, np.nan, np.nan, np.nan, np.nan])
+    seq = EXAMPLE_SEQUENCE_NAN.copy()
     return seq
 
 
-@pytest.fixture()
+# filters return new XY objects, hence the XY fixtures are shared and read-only
+@pytest.fixture(scope="module")
 def example_xy_filter():
+    xy = XY(EXAMPLE_XY_FILTER.copy(), framerate=20)
+    xy.xy.flags.writeable = False
+    return xy
 
-    xy = XY(
-        np.array(
-            [
-                [np.nan, -8.66, np.nan, 1],
-                [np.nan, -6.29, np.nan, 2],
-                [-5.07, -4.31, np.nan, 3],
-                [-2.7, -1.95, np.nan, 4],
-                [np.nan, -0.13, np.nan, 5],
-                [np.nan, 2.31, np.nan, 6],
-                [1.53, 3.74, np.nan, 7],
-                [5.13, 6.53, np.nan, 8],
-                [7.02, 8.07, np.nan, 9],
-                [9.48, 10.53, np.nan, 8],
-                [10.09, np.nan, np.nan, 7],
-                [12.31, np.nan, np.nan, 6],
-                [13.22, np.nan, np.nan, 5],
-                [14.88, 14.88, np.nan, 4],
-                [16.23, 17.05, np.nan, 3],
-                [17.06, 18.37, np.nan, 2],
-                [18.56, 19.27, np.nan, 1],
-                [20.32, 20.46, np.nan, 2],
-                [21.7, 22.61, np.nan, 3],
-                [23.11, 23.54, np.nan, 4],
-                [24.23, 25.25, np.nan, 5],
-                [25.74, 25.95, np.nan, 6],
-                [27.13, 28.06, np.nan, 7],
-                [None, 29.55, np.nan, 8],
-                [30.06, np.nan, np.nan, 9],
-            ]
-        ),
-        framerate=20,
-    )
 
+@pytest.fixture(scope="module")
+def example_xy_filter_with_none():
+    xy = XY(EXAMPLE_XY_FILTER_WITH_NONE.copy(), framerate=20)
+    xy.xy.flags.writeable = False
     return xy
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def example_xy_filter_short():
     xy = XY(np.array([[23.11, 23.54, np.nan], [30.06, np.nan, np.nan]]), framerate=20)
+    xy.xy.flags.writeable = False
     return xy
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def example_xy_filter_one_frame():
     xy = XY(np.array((0, 1, np.nan)), framerate=20)
+    xy.xy.flags.writeable = False
     return xy
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def example_xy_filter_empty():
     xy = XY(np.array(()), framerate=20)
+    xy.xy.flags.writeable = False
     return xy
@@ -5,6 +5,88 @@ from floodlight import XY
 from floodlight.transforms import filter
 
 
+# filtered example_xy_filter when short sequences are kept unfiltered
+EXPECTED_BUTTERWORTH_LOWPASS = np.array(
+    [
+        [np.nan, -8.66, np.nan, 1.18],
+        [np.nan, -6.29, np.nan, 2.28],
+        [-5.07, -4.31, np.nan, 3.32],
+        [-2.7, -1.95, np.nan, 4.26],
+        [np.nan, -0.13, np.nan, 5.07],
+        [np.nan, 2.31, np.nan, 5.71],
+        [1.43, 3.74, np.nan, 6.15],
+        [3.54, 6.53, np.nan, 6.39],
+        [5.61, 8.07, np.nan, 6.41],
+        [7.61, 10.53, np.nan, 6.25],
+        [9.52, np.nan, np.nan, 5.93],
+        [11.34, np.nan, np.nan, 5.49],
+        [13.07, np.nan, np.nan, 5.0],
+        [14.72, 14.88, np.nan, 4.51],
+        [16.29, 17.05, np.nan, 4.08],
+        [17.81, 18.37, np.nan, 3.78],
+        [19.29, 19.27, np.nan, 3.63],
+        [20.75, 20.46, np.nan, 3.67],
+        [22.2, 22.61, np.nan, 3.92],
+        [23.63, 23.54, np.nan, 4.38],
+        [25.06, 25.25, np.nan, 5.02],
+        [26.45, 25.95, np.nan, 5.82],
+        [27.82, 28.06, np.nan, 6.74],
+        [np.nan, 29.55, np.nan, 7.74],
+        [30.06, np.nan, np.nan, 8.77],
+    ],
+    dtype=np.float64,
+)
+EXPECTED_SAVGOL_LOWPASS = np.array(
+    [
+        [np.nan, -8.64, np.nan, 1],
+        [np.nan, -6.39, np.nan, 2],
+        [-5.07, -4.17, np.nan, 3],
+        [-2.7, -2.13, np.nan, 4],
+        [np.nan, 0.11, np.nan, 5],
+        [np.nan, 1.97, np.nan, 6],
+        [1.6, 4.17, np.nan, 7],
+        [4.86, 6.12, np.nan, 8.17],
+        [7.42, 8.34, np.nan, 8.66],
+        [8.98, 10.46, np.nan, 8.17],
+        [10.64, np.nan, np.nan, 7],
+        [11.88, np.nan, np.nan, 6],
+        [13.49, np.nan, np.nan, 5],
+        [14.81, 14.88, np.nan, 4],
+        [16.11, 17.07, np.nan, 3],
+        [17.2, 18.35, np.nan, 1.83],
+        [18.58, 19.27, np.nan, 1.34],
+        [20.23, 20.7, np.nan, 1.83],
+        [21.76, 22.25, np.nan, 3],
+        [23.02, 23.86, np.nan, 4],
+        [24.33, 24.89, np.nan, 5],
+        [25.67, 26.33, np.nan, 6],
+        [27.15, 27.81, np.nan, 7],
+        [np.nan, 29.61, np.nan, 8],
+        [30.06, np.nan, np.nan, 9],
+    ],
+    dtype=np.float64,
+)
+# (start, end) indices per column of example_xy_filter that are too short to filter
+BUTTERWORTH_SHORT_SEQUENCES = {0: ((2, 4), (24, 25)), 1: ((0, 10), (13, 24))}
+SAVGOL_SHORT_SEQUENCES = {0: ((2, 4), (24, 25))}
+
+
+def _remove_sequences(data: np.ndarray, sequences: dict) -> np.ndarray:
+    data = data.copy()
+    for column, column_sequences in sequences.items():
+        for start, end in column_sequences:
+            data[start:end, column] = np.nan
+    return data
+
+
+EXPECTED_BUTTERWORTH_LOWPASS_REMOVED = _remove_sequences(
+    EXPECTED_BUTTERWORTH_LOWPASS, BUTTERWORTH_SHORT_SEQUENCES
+)
+EXPECTED_SAVGOL_LOWPASS_REMOVED = _remove_sequences(
+    EXPECTED_SAVGOL_LOWPASS, SAVGOL_SHORT_SEQUENCES
+)
+
+
 @pytest.mark.unit
 def test_get_sequences(example_sequence: np.ndarray) -> None:
     # Arrange
@@ -86,91 +168,86 @@ def test_get_sequences_nan(example_sequence_nan: np.ndarray) -> None:
     )
 
 
-@pytest.mark.unit
-def test_butterworth_lowpass_remove_seqs_false(example_xy_filter: XY) -> None:
-    # Arrange
-    data = example_xy_filter
+# lowpass filters run on example_xy_filter
+LOWPASS_FILTERS = ("butterworth_lowpass", "savgol_lowpass")
+
+
+# filter results on example_xy_filter, computed once per module and shared by tests
+@pytest.fixture(scope="module")
+def example_xy_filter_results(example_xy_filter: XY) -> dict:
+    results = {
+        (filter_name, remove_short_seqs): getattr(filter, filter_name)(
+            example_xy_filter, remove_short_seqs=remove_short_seqs
+        )
+        for filter_name in LOWPASS_FILTERS
+        for remove_short_seqs in (False, True)
+    }
 
+    return results
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filter_name, remove_short_seqs, expected",
+    [
+        pytest.param(
+            "butterworth_lowpass",
+            False,
+            EXPECTED_BUTTERWORTH_LOWPASS,
+            id="butterworth_remove_seqs_false",
+        ),
+        pytest.param(
+            "butterworth_lowpass",
+            True,
+            EXPECTED_BUTTERWORTH_LOWPASS_REMOVED,
+            id="butterworth_remove_seqs_true",
+        ),
+        pytest.param(
+            "savgol_lowpass",
+            False,
+            EXPECTED_SAVGOL_LOWPASS,
+            id="savgol_remove_seqs_false",
+        ),
+        pytest.param(
+            "savgol_lowpass",
+            True,
+            EXPECTED_SAVGOL_LOWPASS_REMOVED,
+            id="savgol_remove_seqs_true",
+        ),
+    ],
+)
+def test_lowpass_remove_seqs(
+    example_xy_filter_results: dict,
+    filter_name: str,
+    remove_short_seqs: bool,
+    expected: np.ndarray,
+) -> None:
     # Act
-    data_filt = filter.butterworth_lowpass(data)
+    data_filt = example_xy_filter_results[(filter_name, remove_short_seqs)]
 
     # Assert
-    assert np.array_equal(
-        np.round(data_filt, 2),
-        np.array(
-            [
-                [np.nan, -8.66, np.nan, 1.18],
-                [np.nan, -6.29, np.nan, 2.28],
-                [-5.07, -4.31, np.nan, 3.32],
-                [-2.7, -1.95, np.nan, 4.26],
-                [np.nan, -0.13, np.nan, 5.07],
-                [np.nan, 2.31, np.nan, 5.71],
-                [1.43, 3.74, np.nan, 6.15],
-                [3.54, 6.53, np.nan, 6.39],
-                [5.61, 8.07, np.nan, 6.41],
-                [7.61, 10.53, np.nan, 6.25],
-                [9.52, np.nan, np.nan, 5.93],
-                [11.34, np.nan, np.nan, 5.49],
-                [13.07, np.nan, np.nan, 5.0],
-                [14.72, 14.88, np.nan, 4.51],
-                [16.29, 17.05, np.nan, 4.08],
-                [17.81, 18.37, np.nan, 3.78],
-                [19.29, 19.27, np.nan, 3.63],
-                [20.75, 20.46, np.nan, 3.67],
-                [22.2, 22.61, np.nan, 3.92],
-                [23.63, 23.54, np.nan, 4.38],
-                [25.06, 25.25, np.nan, 5.02],
-                [26.45, 25.95, np.nan, 5.82],
-                [27.82, 28.06, np.nan, 6.74],
-                [np.nan, 29.55, np.nan, 7.74],
-                [30.06, np.nan, np.nan, 8.77],
-            ]
-        ),
-        equal_nan=True,
-    )
+    # expected values are rounded to two decimals
+    np.testing.assert_allclose(data_filt, expected, rtol=0, atol=5e-3, equal_nan=True)
 
 
+# missing values given as None are treated like np.nan
 @pytest.mark.unit
-def test_butterworth_lowpass_remove_seqs_true(example_xy_filter: XY) -> None:
-    # Arrange
-    data = example_xy_filter
-
+@pytest.mark.parametrize("remove_short_seqs", [False, True])
+@pytest.mark.parametrize("filter_name", LOWPASS_FILTERS)
+def test_lowpass_none_as_missing_value(
+    example_xy_filter_with_none: XY,
+    example_xy_filter_results: dict,
+    filter_name: str,
+    remove_short_seqs: bool,
+) -> None:
     # Act
-    data_filt = filter.butterworth_lowpass(data, remove_short_seqs=True)
+    data_filt = getattr(filter, filter_name)(
+        example_xy_filter_with_none, remove_short_seqs=remove_short_seqs
+    )
 
     # Assert
-    assert np.array_equal(
-        np.round(data_filt, 2),
-        np.array(
-            [
-                [np.nan, np.nan, np.nan, 1.18],
-                [np.nan, np.nan, np.nan, 2.28],
-                [np.nan, np.nan, np.nan, 3.32],
-                [np.nan, np.nan, np.nan, 4.26],
-                [np.nan, np.nan, np.nan, 5.07],
-                [np.nan, np.nan, np.nan, 5.71],
-                [1.43, np.nan, np.nan, 6.15],
-                [3.54, np.nan, np.nan, 6.39],
-                [5.61, np.nan, np.nan, 6.41],
-                [7.61, np.nan, np.nan, 6.25],
-                [9.52, np.nan, np.nan, 5.93],
-                [11.34, np.nan, np.nan, 5.49],
-                [13.07, np.nan, np.nan, 5.0],
-                [14.72, np.nan, np.nan, 4.51],
-                [16.29, np.nan, np.nan, 4.08],
-                [17.81, np.nan, np.nan, 3.78],
-                [19.29, np.nan, np.nan, 3.63],
-                [20.75, np.nan, np.nan, 3.67],
-                [22.2, np.nan, np.nan, 3.92],
-                [23.63, np.nan, np.nan, 4.38],
-                [25.06, np.nan, np.nan, 5.02],
-                [26.45, np.nan, np.nan, 5.82],
-                [27.82, np.nan, np.nan, 6.74],
-                [np.nan, np.nan, np.nan, 7.74],
-                [np.nan, np.nan, np.nan, 8.77],
-            ]
-        ),
-        equal_nan=True,
+    np.testing.assert_array_equal(
+        data_filt.xy, example_xy_filter_results[(filter_name, remove_short_seqs)].xy
     )
 
 
@@ -233,94 +310,6 @@ def test_butterworth_lowpass_empty(example_xy_filter_empty: XY) -> None:
     assert np.array_equal(data, data_filt, equal_nan=True)
 
 
-@pytest.mark.unit
-def test_savgol_lowpass_remove_seqs_false(example_xy_filter: XY) -> None:
-    # Arrange
-    data = example_xy_filter
-
-    # Act
-    data_filt = filter.savgol_lowpass(data)
-
-    # Assert
-    assert np.array_equal(
-        np.round(data_filt, 2),
-        np.array(
-            [
-                [np.nan, -8.64, np.nan, 1],
-                [np.nan, -6.39, np.nan, 2],
-                [-5.07, -4.17, np.nan, 3],
-                [-2.7, -2.13, np.nan, 4],
-                [np.nan, 0.11, np.nan, 5],
-                [np.nan, 1.97, np.nan, 6],
-                [1.6, 4.17, np.nan, 7],
-                [4.86, 6.12, np.nan, 8.17],
-                [7.42, 8.34, np.nan, 8.66],
-                [8.98, 10.46, np.nan, 8.17],
-                [10.64, np.nan, np.nan, 7],
-                [11.88, np.nan, np.nan, 6],
-                [13.49, np.nan, np.nan, 5],
-                [14.81, 14.88, np.nan, 4],
-                [16.11, 17.07, np.nan, 3],
-                [17.2, 18.35, np.nan, 1.83],
-                [18.58, 19.27, np.nan, 1.34],
-                [20.23, 20.7, np.nan, 1.83],
-                [21.76, 22.25, np.nan, 3],
-                [23.02, 23.86, np.nan, 4],
-                [24.33, 24.89, np.nan, 5],
-                [25.67, 26.33, np.nan, 6],
-                [27.15, 27.81, np.nan, 7],
-                [np.nan, 29.61, np.nan, 8],
-                [30.06, np.nan, np.nan, 9],
-            ]
-        ),
-        equal_nan=True,
-    )
-
-
-@pytest.mark.unit
-def test_savgol_lowpass_remove_seqs_true(example_xy_filter: XY) -> None:
-    # Arrange
-    data = example_xy_filter
-
-    # Act
-    data_filt = filter.savgol_lowpass(data, remove_short_seqs=True)
-
-    # Assert
-    assert np.array_equal(
-        np.round(data_filt, 2),
-        np.array(
-            [
-                [np.nan, -8.64, np.nan, 1],
-                [np.nan, -6.39, np.nan, 2],
-                [np.nan, -4.17, np.nan, 3],
-                [np.nan, -2.13, np.nan, 4],
-                [np.nan, 0.11, np.nan, 5],
-                [np.nan, 1.97, np.nan, 6],
-                [1.6, 4.17, np.nan, 7],
-                [4.86, 6.12, np.nan, 8.17],
-                [7.42, 8.34, np.nan, 8.66],
-                [8.98, 10.46, np.nan, 8.17],
-                [10.64, np.nan, np.nan, 7],
-                [11.88, np.nan, np.nan, 6],
-                [13.49, np.nan, np.nan, 5],
-                [14.81, 14.88, np.nan, 4],
-                [16.11, 17.07, np.nan, 3],
-                [17.2, 18.35, np.nan, 1.83],
-                [18.58, 19.27, np.nan, 1.34],
-                [20.23, 20.7, np.nan, 1.83],
-                [21.76, 22.25, np.nan, 3],
-                [23.02, 23.86, np.nan, 4],
-                [24.33, 24.89, np.nan, 5],
-                [25.67, 26.33, np.nan, 6],
-                [27.15, 27.81, np.nan, 7],
-                [np.nan, 29.61, np.nan, 8],
-                [np.nan, np.nan, np.nan, 9],
-            ]
-        ),
-        equal_nan=True,
-    )
-
-
 @pytest.mark.unit
 def test_savgol_lowpass_short_remove_seqs_false(example_xy_filter_short: XY) -> None:
     # Arrange
@@ -1,53 +1,99 @@
+from typing import NamedTuple, Tuple
+
 import pytest
 import numpy as np
 import matplotlib
-matplotlib.use('agg')
-import matplotlib.pyplot as plt     # noqa: 402
+from matplotlib.figure import Figure
+
+from floodlight.core.xy import XY
+from floodlight.utils.types import Numeric
+
+
+EXAMPLE_POSITIONS = np.array(
+    [
+        [35, 5, 35, 63, 25, 25, 25, 50],
+        [45, 10, 45, 55, 35, 20, 35, 45],
+        [55, 10, 55, 55, 45, 20, 45, 45],
+        [88.5, 20, 88.5, 30, 88.5, 40, 88.5, 50],
+    ],
+    dtype=np.float64,
+)
+
+
+# arguments of plot_football_pitch, in order of its signature
+class FootballPitchInput(NamedTuple):
+    xlim: Tuple[Numeric, Numeric]
+    ylim: Tuple[Numeric, Numeric]
+    length: Numeric
+    width: Numeric
+    unit: str
+    color_scheme: str
+    show_axis_ticks: bool
+    ax: matplotlib.axes.Axes
+
 
-from floodlight.core.xy import XY   # noqa: 402
+# arguments of plot_handball_pitch, in order of its signature
+class HandballPitchInput(NamedTuple):
+    xlim: Tuple[Numeric, Numeric]
+    ylim: Tuple[Numeric, Numeric]
+    unit: str
+    color_scheme: str
+    show_axis_ticks: bool
+    ax: matplotlib.axes.Axes
 
 
-@pytest.fixture()
-def example_input_plot_football_pitch() -> []:
-    ax = plt.subplots()[1]
-    input = [(0, 105), (0, 68), 105, 68, "m", "standard", False, ax]
+# single axes shared by all vis tests, created outside of pyplot so that closing pyplot
+# figures between tests leaves it intact
+@pytest.fixture(scope="session")
+def shared_ax() -> matplotlib.axes.Axes:
+    ax = Figure().subplots()
+
+    return ax
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_ax(shared_ax):
+    shared_ax.clear()
+    yield
+
+
+# plot inputs are immutable and their shared axes is cleared before every test
+@pytest.fixture(scope="session")
+def example_input_plot_football_pitch(shared_ax) -> FootballPitchInput:
+    ax = shared_ax
+    input = FootballPitchInput((0, 105), (0, 68), 105, 68, "m", "standard", False, ax)
 
     return input
 
 
-@pytest.fixture()
-def example_input_plot_football_pitch_axis_ticks() -> []:
-    ax = plt.subplots()[1]
-    input = [(0, 105), (0, 68), 105, 68, "m", "standard", True, ax]
+@pytest.fixture(scope="session")
+def example_input_plot_football_pitch_axis_ticks(shared_ax) -> FootballPitchInput:
+    ax = shared_ax
+    input = FootballPitchInput((0, 105), (0, 68), 105, 68, "m", "standard", True, ax)
 
     return input
 
 
-@pytest.fixture()
-def example_input_plot_handball_pitch() -> []:
-    ax = plt.subplots()[1]
-    input = [(0, 40), (0, 20), "m", "standard", False, ax]
+@pytest.fixture(scope="session")
+def example_input_plot_handball_pitch(shared_ax) -> HandballPitchInput:
+    ax = shared_ax
+    input = HandballPitchInput((0, 40), (0, 20), "m", "standard", False, ax)
 
     return input
 
 
-@pytest.fixture()
-def example_input_plot_handball_pitch_axis_ticks() -> []:
-    ax = plt.subplots()[1]
-    input = [(0, 40), (0, 20), "m", "standard", True, ax]
+@pytest.fixture(scope="session")
+def example_input_plot_handball_pitch_axis_ticks(shared_ax) -> HandballPitchInput:
+    ax = shared_ax
+    input = HandballPitchInput((0, 40), (0, 20), "m", "standard", True, ax)
 
     return input
 
 
-@pytest.fixture()
+# plot functions only read positions, hence the XY object is shared and read-only
+@pytest.fixture(scope="session")
 def example_xy_object() -> XY:
-    pos = np.array(
-        [
-            [35, 5, 35, 63, 25, 25, 25, 50],
-            [45, 10, 45, 55, 35, 20, 35, 45],
-            [55, 10, 55, 55, 45, 20, 45, 45],
-            [88.5, 20, 88.5, 30, 88.5, 40, 88.5, 50],
-        ]
-    )
-
-    return XY(pos)
+    xy = XY(EXAMPLE_POSITIONS.copy())
+    xy.xy.flags.writeable = False
+
+    return xy
@@ -1,10 +1,15 @@
 import pytest
 import numpy as np
 import matplotlib
-matplotlib.use('agg')
-import matplotlib.pyplot as plt     # noqa: 402
 
-from floodlight.vis.pitches import plot_handball_pitch, plot_football_pitch     # noqa: 402
+from floodlight.vis.pitches import plot_handball_pitch, plot_football_pitch
+
+
+# tick locations when axis ticks are shown
+EXPECTED_FOOTBALL_XTICKS = np.arange(-20, 121, 20)
+EXPECTED_FOOTBALL_YTICKS = np.arange(-10.0, 81.0, 10.0)
+EXPECTED_HANDBALL_XTICKS = np.arange(-5, 46, 5)
+EXPECTED_HANDBALL_YTICKS = np.arange(-2.5, 23.0, 2.5)
 
 
 # Test def plot_*_pitch(
@@ -17,45 +22,18 @@ from floodlight.vis.pitches import plot_handball_pitch, plot_football_pitch
 #     show_axis_ticks: bool,
 #     ax: matplotlib.axes,
 #     **kwargs,) -> matplotib.axes
-# Test return
+# Test return and ticks, drawing each pitch once
 # football
-
-
 @pytest.mark.plot
-def test_plot_football_pitch_return_matplotlib_axes(
+def test_plot_football_pitch_return_and_axis_ticks_default(
     example_input_plot_football_pitch,
 ) -> None:
     # Act
-    ax = plot_football_pitch(*example_input_plot_football_pitch)
-    # Assert
-    assert isinstance(ax, matplotlib.axes.Axes)
-    plt.close()
-
-
-# handball
-@pytest.mark.plot
-def test_plot_handball_pitch_return_matplotlib_axes(
-    example_input_plot_handball_pitch,
-) -> None:
-    # Act
-    ax = plot_handball_pitch(*example_input_plot_handball_pitch)
+    ax = plot_football_pitch(**example_input_plot_football_pitch._asdict())
     # Assert
     assert isinstance(ax, matplotlib.axes.Axes)
-    plt.close()
-
-
-# Test ticks
-# football
-@pytest.mark.plot
-def test_plot_football_pitch_show_axis_ticks_default(
-    example_input_plot_football_pitch,
-) -> None:
-    # Act
-    ax = plot_football_pitch(*example_input_plot_football_pitch)
-    # Assert
     assert ax.get_xticks() == []
     assert ax.get_yticks() == []
-    plt.close()
 
 
 @pytest.mark.plot
@@ -63,29 +41,23 @@ def test_plot_football_pitch_show_axis_ticks_True(
     example_input_plot_football_pitch_axis_ticks,
 ) -> None:
     # Act
-    ax = plot_football_pitch(*example_input_plot_football_pitch_axis_ticks)
+    ax = plot_football_pitch(**example_input_plot_football_pitch_axis_ticks._asdict())
     # Assert
-    assert np.array_equal(
-        np.array(ax.get_xticks()), np.array([-20, 0, 20, 40, 60, 80, 100, 120])
-    )
-    assert np.array_equal(
-        np.array(ax.get_yticks()),
-        np.array([-10.0, 0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0]),
-    )
-    plt.close()
+    np.testing.assert_array_equal(ax.get_xticks(), EXPECTED_FOOTBALL_XTICKS)
+    np.testing.assert_array_equal(ax.get_yticks(), EXPECTED_FOOTBALL_YTICKS)
 
 
 # handball
 @pytest.mark.plot
-def test_plot_handball_pitch_show_axis_ticks_default(
+def test_plot_handball_pitch_return_and_axis_ticks_default(
     example_input_plot_handball_pitch,
 ) -> None:
     # Act
-    ax = plot_handball_pitch(*example_input_plot_handball_pitch)
+    ax = plot_handball_pitch(**example_input_plot_handball_pitch._asdict())
     # Assert
+    assert isinstance(ax, matplotlib.axes.Axes)
     assert ax.get_xticks() == []
     assert ax.get_yticks() == []
-    plt.close()
 
 
 @pytest.mark.plot
@@ -93,13 +65,7 @@ def test_plot_handball_pitch_show_axis_ticks_True(
     example_input_plot_handball_pitch_axis_ticks,
 ) -> None:
     # Act
-    ax = plot_handball_pitch(*example_input_plot_handball_pitch_axis_ticks)
+    ax = plot_handball_pitch(**example_input_plot_handball_pitch_axis_ticks._asdict())
     # Assert
-    assert np.array_equal(
-        np.array(ax.get_xticks()), np.array([-5, 0, 5, 10, 15, 20, 25, 30, 35, 40, 45])
-    )
-    assert np.array_equal(
-        np.array(ax.get_yticks()),
-        np.array([-2.5, 0, 2.5, 5, 7.5, 10, 12.5, 15, 17.5, 20, 22.5]),
-    )
-    plt.close()
+    np.testing.assert_array_equal(ax.get_xticks(), EXPECTED_HANDBALL_XTICKS)
+    np.testing.assert_array_equal(ax.get_yticks(), EXPECTED_HANDBALL_YTICKS)